@@ -79,10 +79,7 @@ def type_convert_stored(
     Ref: https://github.com/canonical/operator/pull/572
     """
     if isinstance(obj, StoredList):
-        return list(map(type_convert_stored, obj))
+        return [type_convert_stored(v) for v in obj]
     if isinstance(obj, StoredDict):
-        rdict: Dict[Any, Any] = {}
-        for k in obj.keys():
-            rdict[k] = type_convert_stored(obj[k])
-        return rdict
+        return {k: type_convert_stored(v) for k, v in obj.items()}
     return obj
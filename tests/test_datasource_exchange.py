@@ -1,4 +1,5 @@
 import json
+from typing import Optional, Tuple
 
 import pytest
 from ops import CharmBase, Framework
@@ -12,6 +13,57 @@ from cosl.interfaces.datasource_exchange import (
     GrafanaDatasource,
 )
 
+_DS_REQUIRER_IN = [
+    {"type": "c", "uid": "3", "grafana_uid": "4"},
+    {"type": "a", "uid": "1", "grafana_uid": "5"},
+    {"type": "b", "uid": "2", "grafana_uid": "6"},
+]
+_DS_PROVIDER_IN = [{"type": "d", "uid": "4", "grafana_uid": "7"}]
+
+_DS_REQUIRER_APP_DATA = DSExchangeAppData(
+    datasources=json.dumps(sorted(_DS_REQUIRER_IN, key=lambda raw_ds: raw_ds["uid"]))
+).dump()
+_DS_PROVIDER_APP_DATA = DSExchangeAppData(
+    datasources=json.dumps(sorted(_DS_PROVIDER_IN, key=lambda raw_ds: raw_ds["uid"]))
+).dump()
+
+
+class BadCharm(CharmBase):
+    declared: Tuple[Optional[str], Optional[str]] = (None, None)
+
+    def __init__(self, framework: Framework):
+        super().__init__(framework)
+        prov, req = self.declared
+        self.ds_exchange = DatasourceExchange(self, provider_endpoint=prov, requirer_endpoint=req)
+
+
+class MyPublisherCharm(CharmBase):
+    META = {
+        "name": "robbie",
+        "provides": {"foo": {"interface": "grafana_datasource_exchange"}},
+    }
+
+    def __init__(self, framework: Framework):
+        super().__init__(framework)
+        self.ds_exchange = DatasourceExchange(
+            self, provider_endpoint="foo", requirer_endpoint=None
+        )
+        self.ds_exchange.publish([{"type": "tempo", "uid": "123", "grafana_uid": "123123"}])
+
+
+class MyCharm(CharmBase):
+    META = {
+        "name": "robbie",
+        "provides": {"foo": {"interface": "grafana_datasource_exchange"}},
+        "requires": {"bar": {"interface": "grafana_datasource_exchange"}},
+    }
+
+    def __init__(self, framework: Framework):
+        super().__init__(framework)
+        self.ds_exchange = DatasourceExchange(
+            self, provider_endpoint="foo", requirer_endpoint="bar"
+        )
+
 
 @pytest.mark.parametrize(
     "meta, declared",
@@ -36,16 +88,9 @@ from cosl.interfaces.datasource_exchange import (
         ),
     ),
 )
-def test_endpoint_validation_failure(meta, declared):
+def test_endpoint_validation_failure(monkeypatch, meta, declared):
     # GIVEN a charm with this metadata and declared provider/requirer endpoints
-
-    class BadCharm(CharmBase):
-        def __init__(self, framework: Framework):
-            super().__init__(framework)
-            prov, req = declared
-            self.ds_exchange = DatasourceExchange(
-                self, provider_endpoint=prov, requirer_endpoint=req
-            )
+    monkeypatch.setattr(BadCharm, "declared", declared)
 
     # WHEN any event is processed
     with pytest.raises(UncaughtCharmError) as e:
@@ -80,15 +125,9 @@ def test_endpoint_validation_failure(meta, declared):
         ),
     ),
 )
-def test_endpoint_validation_ok(meta, declared):
+def test_endpoint_validation_ok(monkeypatch, meta, declared):
     # GIVEN a charm with this metadata and declared provider/requirer endpoints
-    class BadCharm(CharmBase):
-        def __init__(self, framework: Framework):
-            super().__init__(framework)
-            prov, req = declared
-            self.ds_exchange = DatasourceExchange(
-                self, provider_endpoint=prov, requirer_endpoint=req
-            )
+    monkeypatch.setattr(BadCharm, "declared", declared)
 
     # WHEN any event is processed
     ctx = Context(BadCharm, meta={"name": "bob", **meta})
@@ -98,20 +137,7 @@ def test_endpoint_validation_ok(meta, declared):
 
 def test_ds_publish():
     # GIVEN a charm with a single datasource_exchange relation
-    class MyCharm(CharmBase):
-        META = {
-            "name": "robbie",
-            "provides": {"foo": {"interface": "grafana_datasource_exchange"}},
-        }
-
-        def __init__(self, framework: Framework):
-            super().__init__(framework)
-            self.ds_exchange = DatasourceExchange(
-                self, provider_endpoint="foo", requirer_endpoint=None
-            )
-            self.ds_exchange.publish([{"type": "tempo", "uid": "123", "grafana_uid": "123123"}])
-
-    ctx = Context(MyCharm, meta=MyCharm.META)
+    ctx = Context(MyPublisherCharm, meta=MyPublisherCharm.META)
 
     dse_in = Relation("foo")
     state_in = State(relations={dse_in}, leader=True)
@@ -129,46 +155,16 @@ def test_ds_publish():
 
 def test_ds_receive():
     # GIVEN a charm with a single datasource_exchange relation
-    class MyCharm(CharmBase):
-        META = {
-            "name": "robbie",
-            "provides": {"foo": {"interface": "grafana_datasource_exchange"}},
-            "requires": {"bar": {"interface": "grafana_datasource_exchange"}},
-        }
-
-        def __init__(self, framework: Framework):
-            super().__init__(framework)
-            self.ds_exchange = DatasourceExchange(
-                self, provider_endpoint="foo", requirer_endpoint="bar"
-            )
-
     ctx = Context(MyCharm, meta=MyCharm.META)
 
-    ds_requirer_in = [
-        {"type": "c", "uid": "3", "grafana_uid": "4"},
-        {"type": "a", "uid": "1", "grafana_uid": "5"},
-        {"type": "b", "uid": "2", "grafana_uid": "6"},
-    ]
-    ds_provider_in = [{"type": "d", "uid": "4", "grafana_uid": "7"}]
-
-    dse_requirer_in = Relation(
-        "foo",
-        remote_app_data=DSExchangeAppData(
-            datasources=json.dumps(sorted(ds_provider_in, key=lambda raw_ds: raw_ds["uid"]))
-        ).dump(),
-    )
-    dse_provider_in = Relation(
-        "bar",
-        remote_app_data=DSExchangeAppData(
-            datasources=json.dumps(sorted(ds_requirer_in, key=lambda raw_ds: raw_ds["uid"]))
-        ).dump(),
-    )
+    dse_requirer_in = Relation("foo", remote_app_data=_DS_PROVIDER_APP_DATA)
+    dse_provider_in = Relation("bar", remote_app_data=_DS_REQUIRER_APP_DATA)
     state_in = State(relations={dse_requirer_in, dse_provider_in}, leader=True)
 
     # WHEN we receive any event
     with ctx(ctx.on.update_status(), state_in) as mgr:
         # THEN we can access all datasources we're given
         dss = mgr.charm.ds_exchange.received_datasources
-        assert [ds.type for ds in dss] == list("abcd")
-        assert [ds.uid for ds in dss] == list("1234")
+        assert [ds.type for ds in dss] == ["a", "b", "c", "d"]
+        assert [ds.uid for ds in dss] == ["1", "2", "3", "4"]
         assert isinstance(dss[0], GrafanaDatasource)
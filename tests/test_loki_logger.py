@@ -3,7 +3,7 @@
 
 import json
 import logging
-from typing import List
+from typing import List, Tuple
 from unittest.mock import _Call, patch
 from urllib.error import HTTPError
 
@@ -12,21 +12,18 @@ import pytest
 from cosl.loki_logger import LokiHandler
 
 
-def _get_loki_http_post_payload(call: _Call):
-    """Extract the POSTed json payload from the intercepted LokiLogger calls."""
-    return json.loads(call.args[1].decode("utf-8"))
+def _decode_calls(calls: List[_Call]) -> List[Tuple[str, str, str]]:
+    """Extract (url, severity, log line) from the intercepted LokiLogger calls.
 
-
-def _get_logs_severity(calls: List[_Call]):
-    """Extract the loglevel from the intercepted LokiLogger calls."""
-    return [
-        _get_loki_http_post_payload(call)["streams"][0]["stream"]["severity"] for call in calls
-    ]
-
-
-def _get_loki_urls(calls: List[_Call]):
-    """Extract the loki urls from the intercepted lokilogger calls."""
-    return [call.args[0].full_url for call in calls]
+    Each POSTed json payload is decoded only once.
+    """
+    decoded = []
+    for call in calls:
+        stream = json.loads(call.args[1])["streams"][0]
+        decoded.append(
+            (call.args[0].full_url, stream["stream"]["severity"], stream["values"][0][1])
+        )
+    return decoded
 
 
 @pytest.mark.parametrize("n_lokis", (1, 2, 5))
@@ -68,11 +65,10 @@ def test_root_logging(send_request, n_lokis, loglevel_info):
 
     assert send_request.call_count == 2 * n_lokis
 
-    assert _get_loki_urls(send_request.call_args_list) == urls * 2
-
-    assert (
-        _get_logs_severity(send_request.call_args_list) == ["info"] * n_lokis + ["error"] * n_lokis
-    )
+    sent_urls, severities, lines = zip(*_decode_calls(send_request.call_args_list))
+    assert list(sent_urls) == urls * 2
+    assert list(severities) == ["info"] * n_lokis + ["error"] * n_lokis
+    assert list(lines) == ["something"] * n_lokis + ["something else"] * n_lokis
 
 
 @patch("cosl.loki_logger.LokiEmitter._send_request")
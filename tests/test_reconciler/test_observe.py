@@ -7,6 +7,13 @@ from scenario.context import CharmEvents
 
 from cosl.reconciler import all_events, observe_events
 
+_LUCA_META = {
+    "name": "luca",
+    "requires": {"bax": {"interface": "bar"}},
+    "containers": {"foo": {}},
+}
+_EMPTY_STATE = State()
+
 
 def get_observed_events(observe_mock):
     return {call.args[0].event_type for call in observe_mock.call_args_list}
@@ -46,50 +53,109 @@ def test_observe_events(charm, observe_mock, event_arg):
     assert observed_events == all_events
 
 
+class LucaEmissionCharm(ops.CharmBase):
+    """A regular luca charm that only observes certain event types."""
+
+    handler_takes_event = True
+
+    def __init__(self, *a, **kw):
+        super().__init__(*a, **kw)
+        observe_events(
+            self,
+            events={ops.RelationEvent, ops.SecretEvent, ops.StorageEvent},
+            handler=self._event_observer if self.handler_takes_event else self._reconcile,
+        )
+
+    def _event_observer(self, _):  # observe target
+        self._reconcile()
+
+    def _reconcile(self):  # observe target
+        self.reconcile()
+
+    def reconcile(self):  # mock target (for testing)
+        pass
+
+
+@pytest.fixture
+def emission_ctx():
+    with Context(LucaEmissionCharm, meta=_LUCA_META, actions={"foo": {}}) as ctx:
+        yield ctx
+
+
+@pytest.mark.parametrize("event_name", ("upgrade_charm", "update_status", "install", "stop"))
 @pytest.mark.parametrize("event_arg", (True, False))
-def test_observe_emission(event_arg):
+def test_observe_emission_excluded(emission_ctx, monkeypatch, event_arg, event_name):
     # GIVEN a regular luca charm that only observes certain event types
-    class LucaCharm(ops.CharmBase):
-        def __init__(self, *a, **kw):
-            super().__init__(*a, **kw)
-            observe_events(
-                self,
-                events={ops.RelationEvent, ops.SecretEvent, ops.StorageEvent},
-                handler=self._event_observer if event_arg else self._reconcile,
-            )
+    monkeypatch.setattr(LucaEmissionCharm, "handler_takes_event", event_arg)
 
-        def _event_observer(self, _):  # observe target
-            self._reconcile()
+    # WHEN an excluded event is emitted
+    with patch.object(LucaEmissionCharm, "reconcile", MagicMock()) as mm:
+        emission_ctx.run(getattr(emission_ctx.on, event_name)(), state=_EMPTY_STATE)
 
-        def _reconcile(self):  # observe target
-            self.reconcile()
+    # THEN the reconciler does NOT get called
+    assert not mm.called
 
-        def reconcile(self):  # mock target (for testing)
-            pass
 
-    # WHEN we observe_events
-    ctx = Context(
-        LucaCharm,
-        meta={
-            "name": "luca",
-            "requires": {"bax": {"interface": "bar"}},
-            "containers": {"foo": {}},
-        },
-        actions={"foo": {}},
-    )
-    with patch.object(LucaCharm, "reconcile", MagicMock()) as mm:
-        # THEN the reconciler does NOT get called on excluded events
-        ctx.run(ctx.on.upgrade_charm(), state=State())
-        ctx.run(ctx.on.update_status(), state=State())
-        ctx.run(ctx.on.install(), state=State())
-        ctx.run(ctx.on.stop(), state=State())
-        assert not mm.called
-
-    with patch.object(LucaCharm, "reconcile", MagicMock()) as mm:
+@pytest.mark.parametrize("event_arg", (True, False))
+def test_observe_emission_included(emission_ctx, monkeypatch, event_arg):
+    # GIVEN a regular luca charm that only observes certain event types
+    monkeypatch.setattr(LucaEmissionCharm, "handler_takes_event", event_arg)
+
+    # WHEN an included event is emitted
+    with patch.object(LucaEmissionCharm, "reconcile", MagicMock()) as mm:
         relation = Relation("bax")
-        ctx.run(ctx.on.relation_changed(relation), state=State(relations={relation}))
-        # THEN the reconciler gets called on included events
-        assert mm.called
+        emission_ctx.run(
+            emission_ctx.on.relation_changed(relation), state=State(relations={relation})
+        )
+
+    # THEN the reconciler gets called
+    assert mm.called
+
+
+class LucaGroupsCharm(ops.CharmBase):
+    """A regular luca charm that observes each event type with a different handler."""
+
+    def __init__(self, *a, **kw):
+        super().__init__(*a, **kw)
+        observe_events(
+            self,
+            events=(ops.InstallEvent,),
+            handler=self._install,
+        )
+        observe_events(
+            self,
+            events=[ops.UpgradeCharmEvent],
+            handler=self._upgradecharm,
+        )
+        observe_events(
+            self,
+            events={ops.UpdateStatusEvent},
+            handler=self._updatestatus,
+        )
+
+    def _updatestatus(self):  # observe target
+        self.updatestatus()
+
+    def _upgradecharm(self):  # observe target
+        self.upgradecharm()
+
+    def _install(self):  # observe target
+        self.install()
+
+    def updatestatus(self):  # mock target (for testing)
+        pass
+
+    def upgradecharm(self):  # mock target (for testing)
+        pass
+
+    def install(self):  # mock target (for testing)
+        pass
+
+
+@pytest.fixture
+def groups_ctx():
+    with Context(LucaGroupsCharm, meta=_LUCA_META, actions={"foo": {}}) as ctx:
+        yield ctx
 
 
 @pytest.mark.parametrize(
@@ -100,61 +166,15 @@ def test_observe_emission(event_arg):
         (CharmEvents.update_status(), "updatestatus"),
     ),
 )
-def test_observe_groups(event, name):
+def test_observe_groups(groups_ctx, event, name):
     # GIVEN a regular luca charm that only observes certain event types
-    class LucaCharm(ops.CharmBase):
-        def __init__(self, *a, **kw):
-            super().__init__(*a, **kw)
-            observe_events(
-                self,
-                events=(ops.InstallEvent,),
-                handler=self._install,
-            )
-            observe_events(
-                self,
-                events=[ops.UpgradeCharmEvent],
-                handler=self._upgradecharm,
-            )
-            observe_events(
-                self,
-                events={ops.UpdateStatusEvent},
-                handler=self._updatestatus,
-            )
-
-        def _updatestatus(self):  # observe target
-            self.updatestatus()
-
-        def _upgradecharm(self):  # observe target
-            self.upgradecharm()
-
-        def _install(self):  # observe target
-            self.install()
-
-        def updatestatus(self):  # mock target (for testing)
-            pass
-
-        def upgradecharm(self):  # mock target (for testing)
-            pass
-
-        def install(self):  # mock target (for testing)
-            pass
-
     # WHEN we observe_events
-    ctx = Context(
-        LucaCharm,
-        meta={
-            "name": "luca",
-            "requires": {"bax": {"interface": "bar"}},
-            "containers": {"foo": {}},
-        },
-        actions={"foo": {}},
-    )
     mocks = [MagicMock(), MagicMock(), MagicMock()]
-    with patch.object(LucaCharm, "updatestatus", mocks[0]):
-        with patch.object(LucaCharm, "upgradecharm", mocks[1]):
-            with patch.object(LucaCharm, "install", mocks[2]):
+    with patch.object(LucaGroupsCharm, "updatestatus", mocks[0]):
+        with patch.object(LucaGroupsCharm, "upgradecharm", mocks[1]):
+            with patch.object(LucaGroupsCharm, "install", mocks[2]):
                 # THEN the right reconciler gets called
-                ctx.run(event, state=State())
+                groups_ctx.run(event, state=_EMPTY_STATE)
 
                 expected = {
                     "install": [False, False, True],